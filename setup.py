@@ -5,7 +5,10 @@
             packages=find_packages(),
             install_requires=[
                 'weaviate-client',
-                'streamlit'
+                'streamlit>=1.37',
+                'orjson',
+                'ijson',
+                'httpx[http2]'
                 # Add other dependencies here
             ],
             python_requires='>=3.11',
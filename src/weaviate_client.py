@@ -1,19 +1,72 @@
 import streamlit as st
 import weaviate_wrapper as weaviate_wrapper
 import pandas as pd
-import json
-import os
+import orjson
+import ijson
 
 stst=st.session_state
 
 st.markdown(f'<H6>Weaviate client</H6>',unsafe_allow_html=True)
 
 
+@st.cache_resource
+def get_wv(port: int) -> weaviate_wrapper.WeaviateClient:
+    # One persistent Weaviate client per port, shared across reruns and sessions
+    return weaviate_wrapper.WeaviateClient(port=port)
+
+
+@st.cache_data(ttl=30)
+def list_collection_names(port: int) -> list:
+    # Collection names rarely change; cleared explicitly on create/delete
+    collections_dict = get_wv(port).list_collections()
+    return list(collections_dict.keys()) if collections_dict else []
+
+
+def is_json_array(fl) -> bool:
+    # Peek at the first non-blank byte of an uploaded file, leaving it rewound
+    fl.seek(0)
+    head = fl.read(1024).lstrip()[:1]
+    fl.seek(0)
+    return head == b"["
+
+
+def flatten_rows(rows: list) -> dict:
+    # Rows to columns in one pass; nested dicts become dotted columns like json_normalize
+    cols = {}
+
+    def walk(obj: dict, prefix: str, i: int):
+        for k, v in obj.items():
+            key = prefix + str(k)
+            if isinstance(v, dict) and v:
+                walk(v, key + ".", i)
+                continue
+            col = cols.get(key)
+            if col is None:
+                col = cols[key] = [None] * i
+            col.append(v)
+
+    for i, row in enumerate(rows):
+        walk(row, "", i)
+        for col in cols.values():
+            if len(col) == i:
+                col.append(None)
+    return cols
+
+
+def to_frame(rows: list) -> pd.DataFrame:
+    # Flat rows (the usual Weaviate case) go straight to pandas
+    if all(not isinstance(v, (dict, list)) for v in rows[0].values()):
+        return pd.DataFrame.from_records(rows)
+    return pd.DataFrame(flatten_rows(rows))
+
+
 class WeaviateStreamlitApp:
     def __init__(self, port: int = 8080):
         # Initialize Weaviate client and session state
-        self.wv = weaviate_wrapper.WeaviateClient(port=port)
+        self.port = port
+        self.wv = get_wv(port)
         self.stst = st.session_state
+        self._decoder = orjson.loads # Decoder for JSON typed into the Insert data form
         self.modes=["Fetch rows","Insert data","Search","New collection","Bulk insert","Delete collection"]
         self.initialize_collection()
         self.pivot()
@@ -23,11 +76,11 @@ class WeaviateStreamlitApp:
 
     def initialize_collection(self):
         try:
-            collections_dict = self.wv.list_collections()
-            # Convert dictionary keys to a list for selectbox
-            collections_list = list(collections_dict.keys()) if collections_dict else []
+            collections_list = list_collection_names(self.port)
             
             if not collections_list:
+                # An empty list may mean Weaviate was unreachable; don't keep it cached
+                list_collection_names.clear()
                 st.warning("No collections found. Please create one first.")
                 self.stst["collection"] = None
                 self.create_collection()
@@ -37,7 +90,8 @@ class WeaviateStreamlitApp:
             collection = st.sidebar.selectbox("Collection", self.stst["collections"])
             self.stst["collection"] = collection
         except Exception as e:
-            st.error(f"Failed to initialize collection. Check connection and port. : \n {str(e)}")
+            st.error("Failed to initialize collection. Check connection and port.")
+            st.exception(e)
 
     def fetch_rows(self, numrows: int = 20):
         """
@@ -46,42 +100,82 @@ class WeaviateStreamlitApp:
         Args:
             numrows (int): The number of rows to display in the data editor.
         """
-        if not self.stst.get("collection"):
+        coll = self.stst.get("collection")
+        if not coll:
             st.info("Please select or create a collection first.")
             return
-        ls = self.wv.get_collection_data(self.stst['collection'])
+        limit = int(st.number_input("Limit", min_value=1, value=100, step=100))
+        if st.button("Refresh"):
+            self.stst.pop("rows_key", None)
+        # Keep the loaded pages across reruns; refetch only on Refresh or when the collection or limit changes
+        if self.stst.get("rows_key") != (coll, limit):
+            ls, cursor = self.wv.get_collection_data(coll, limit=limit)
+            if ls is None:
+                # Not cached, so the next rerun tries again
+                self.stst.pop("rows_key", None)
+                st.error("Failed to fetch rows. Check connection and port.")
+                return
+            self.stst["rows"], self.stst["cursor"] = ls, cursor
+            self.stst["rows_key"] = (coll, limit)
+        ls = self.stst["rows"]
         if ls:
-            data = pd.json_normalize(ls)
+            data = to_frame(ls)
             st.data_editor(data, use_container_width=True, num_rows=numrows, hide_index=True)
+            if self.stst["cursor"]:
+                st.button("Load more", on_click=self.load_more_rows, args=(coll, limit))
+            if self.stst.pop("load_more_failed", False):
+                st.error("Failed to load more rows. Check connection and port.")
         else:
-            st.info(f"No data found in collection '{self.stst['collection']}'.")
+            st.info(f"No data found in collection '{coll}'.")
+
+    def load_more_rows(self, coll: str, limit: int):
+        """
+        Appends the next page of rows to the ones already loaded by fetch_rows.
+
+        Args:
+            coll (str): The collection whose rows are on screen.
+            limit (int): The number of rows to fetch.
+        """
+        ls, cursor = self.wv.get_collection_data(coll, limit=limit, after=self.stst["cursor"])
+        if ls is None:
+            # Keep the cursor so "Load more" stays available; fetch_rows shows the error
+            self.stst["load_more_failed"] = True
+            return
+        self.stst["rows"] = self.stst["rows"] + ls
+        self.stst["cursor"] = cursor
 
     def search(self):
-        if not self.stst.get("collection"):
+        coll = self.stst.get("collection")
+        if not coll:
             st.info("Please select or create a collection first.")
             return
         txt = st.text_input("Search Query")
         srch = st.button("Search")
         if srch and txt:
-            res = self.wv.search(txt, collection_name=self.stst['collection'])
+            res = self.wv.search(txt, collection_name=coll)
             if isinstance(res, list) and res:
-                st.dataframe(pd.json_normalize(res))
+                st.dataframe(to_frame(res))
             else:
                 st.info(res)
     def create_collection(self):
         collection_name=st.text_input("Collection name")
         if st.button("Create"):
             try:
-                self.wv.create_collection(collection_name)
+                res=self.wv.create_collection(collection_name)
             except:
                 st.error("Error creating collection")
             else:
-                st.success(f"The collection {collection_name} created successfully")
+                if res==True:
+                    list_collection_names.clear()
+                    st.success(f"The collection {collection_name} created successfully")
+                else:
+                    st.error(res)
     
 
     def insert_data(self):
 
-        if not self.stst.get("collection"):
+        coll = self.stst.get("collection")
+        if not coll:
             st.info("Please select or create a collection first.")
             return
 
@@ -89,111 +183,137 @@ class WeaviateStreamlitApp:
         data=s.text_area("Data in JSON")
         if s.button("Insert"):
             try:
-                dic=json.loads(data)
+                dic=self._decoder(data)
             except Exception as e:
                 st.error("Invalid JSON format")
                 return
             try:
-                res=self.wv.add_data(data=dic, collection_name=stst['collection'])
+                res=self.wv.add_data(data=dic, collection_name=coll)
                 if res ==True:
+                    self.stst.pop("rows_key", None)
                     st.success("Data inserted successfully")
                 else:
                     st.error("Error inserting data:\n"+res)
             except Exception as e:
-                st.error(f"Error inserting data: {e}")
+                st.error("Error inserting data")
+                st.exception(e)
 
     def insert_bulk_data(self):
 
-        if not self.stst.get("collection"):
+        coll = self.stst.get("collection")
+        if not coll:
             st.info("Please select or create a collection first.")
             return
-        if not os.path.exists("temp"):
-            os.mkdir("temp")
         with st.form("Insert bulk data", clear_on_submit=True):
             fl = st.file_uploader("Upload JSON file")
             submitted = st.form_submit_button("upload")
             if submitted ==True and fl is not None:
-                with open(f"temp/{fl.name}","wb") as f:
-                    f.write(fl.getbuffer())
-                    stst["fname"]=fl.name
-            dic=None
-            try:
-                if stst["fname"]:
-                    with open(f"temp/{stst['fname']}","r") as f:
-                        dic=json.load(f)                                        
-            except Exception as e:
-                st.error("Invalid JSON format? :"+str(e))
-                return
+                # Validate the whole upload before anything is inserted; arrays are only
+                # scanned here, then streamed again on insert
+                try:
+                    if is_json_array(fl):
+                        for _ in ijson.parse(fl):
+                            pass
+                    else:
+                        orjson.loads(fl.getvalue())
+                except Exception as e:
+                    # Forget any earlier upload so Insert can't pick it up after this error
+                    stst.pop("bulk_file", None)
+                    st.error("Invalid JSON format")
+                    st.exception(e)
+                    return
+                stst["bulk_file"]=fl
+        fl=stst.get("bulk_file")
         if st.button("Insert"):
+            if fl is None:
+                st.info("Please upload a JSON file first.")
+                return
             try:
-                if dic:
-                    res=self.wv.add_data(data=dic, collection_name=stst['collection'])
+                if is_json_array(fl):
+                    # Stream the array so upload starts before the whole file is parsed
+                    res=self.wv.add_data_iter(ijson.items(fl, "item", use_float=True), collection_name=coll)
+                else:
+                    res=self.wv.add_data(data=orjson.loads(fl.getvalue()), collection_name=coll)
                 if res ==True:
+                    self.stst.pop("rows_key", None)
                     st.success("Data inserted successfully")
-                    os.remove(f"temp/{stst['fname']}")
-                    stst["fname"]=None
+                    stst["bulk_file"]=None
                 else:
                     st.error("Error inserting data:\n"+res)
             except Exception as e:
-                st.error(f"Error inserting data: {e}")
+                st.error("Error inserting data")
+                st.exception(e)
 
 
     def delete_collection(self):
+            coll=stst['collection']
             s=st.sidebar.empty()
             sx=s.expander("Delete collection",expanded=True)
             
-            sx.warning(f"Are you sure you want to delete the collection: {stst['collection']}?")
+            sx.warning(f"Are you sure you want to delete the collection: {coll}?")
             if sx.button(f"Yes, go ahead"):
 
                 try:
-                    res=self.wv.delete_collection(stst['collection'])
+                    res=self.wv.delete_collection(coll)
                     if res==True:
-                        s.success(f"Collection '{stst['collection']}' deleted successfully.")
+                        list_collection_names.clear()
+                        self.stst.pop("rows_key", None)
+                        s.success(f"Collection '{coll}' deleted successfully.")
 
                 except Exception as e:
-                    s.error(f"Error deleting collection '{stst['collection']}': {e}")
+                    with s.container():
+                        st.error(f"Error deleting collection '{coll}'")
+                        st.exception(e)
 
 
 
+    @st.fragment
+    def run_fragment(self, action, failure: str):
+        """
+        Runs a mode as a Streamlit fragment, so interacting with its widgets reruns only
+        that mode instead of the whole app.
+
+        Args:
+            action (Callable): The mode method to run.
+            failure (str): What failed, used in the error message.
+        """
+        try:
+            action()
+        except Exception as e:
+            st.error(f"Failed to {failure}. Check connection and port.")
+            st.exception(e)
+
     def pivot(self):
         """
         Pivots the application's functionality based on the selected mode in the sidebar.
         Each mode (Fetch rows, Insert data, Search, New collection) calls the corresponding
         method of the WeaviateStreamlitApp class, wrapped in a try-except block for error handling.
+        Modes that only touch the main area run as fragments; creating and deleting collections
+        use the sidebar and change the collection list, so they still rerun the whole app.
         """
         modee=st.sidebar.selectbox("Mode",self.modes)
 
         if modee=="Fetch rows":
-            try:
-                self.fetch_rows()
-            except Exception as e:
-                st.error(f"Failed to fetch rows. Check connection and port. : \n {str(e)}")
+            self.run_fragment(self.fetch_rows, "fetch rows")
         elif modee=="Insert data":
-            try:
-                self.insert_data()
-            except Exception as e:
-                st.error(f"Failed to insert data. Check connection and port. : \n {str(e)}")
+            self.run_fragment(self.insert_data, "insert data")
         elif modee=="Search":
-            try:
-                self.search()
-            except Exception as e:
-                st.error(f"Failed to search. Check connection and port. : \n {str(e)}")
+            self.run_fragment(self.search, "search")
         elif modee=="New collection":
             try:
                 self.create_collection()
             except Exception as e:
-                st.error(f"Failed to create collection. Check connection and port. : \n {str(e)}")
+                st.error("Failed to create collection. Check connection and port.")
+                st.exception(e)
 
         elif modee=="Delete collection":
             try:
                 self.delete_collection()
             except Exception as e:
-                st.error(f"Failed to delete collection. Check connection and port. : \n {str(e)}")
+                st.error("Failed to delete collection. Check connection and port.")
+                st.exception(e)
         elif modee=="Bulk insert":
-            try:
-                self.insert_bulk_data()
-            except Exception as e:
-                st.error(f"Failed to insert bulk data. Check connection and port. : \n {str(e)}")
+            self.run_fragment(self.insert_bulk_data, "insert bulk data")
 
 
                          
@@ -1,10 +1,19 @@
 import weaviate
+import httpx
+import orjson
 from weaviate.classes.config import Configure
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from pprint import pprint
 import json
 import os
+import time
+import asyncio
+import atexit
 import logging
-from typing import List, Dict, Any, Union
+import multiprocessing
+import logging.handlers
+from typing import List, Dict, Any, Union, Optional, Tuple, Iterable, Set
 
 # --- Logging Setup ---
 # Define a directory for logs
@@ -18,13 +27,15 @@ if not os.path.exists(log_directory):
 current_file_name_base = os.path.basename(__file__).split('.')[0]
 log_file_path = os.path.join(log_directory, f"{current_file_name_base}.log")
 
-# Configure basic logging
-logging.basicConfig(
-    filename=log_file_path,
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s: %(message)s",
-)
-logging.info(f"'{current_file_name_base}' module started.")
+# Configure logging: records are buffered in memory and written to the file in blocks
+# of 1000, or immediately when an ERROR arrives (and at interpreter exit)
+root_logger = logging.getLogger()
+if not root_logger.handlers:
+    file_handler = logging.FileHandler(log_file_path)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
+    root_logger.addHandler(logging.handlers.MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=file_handler))
+    root_logger.setLevel(logging.INFO)
+logging.info("'%s' module started.", current_file_name_base)
 
 class WeaviateClient:
     """
@@ -32,6 +43,8 @@ class WeaviateClient:
     data addition, and semantic search.
     """
 
+    schema_ttl = 30 # Seconds a fetched collection list is reused by list_collections
+
     def __init__(self, port: int = 8080, ollama_api_endpoint: str = "http://host.docker.internal:11434"):
         """
         Initializes the Weaviate client.
@@ -44,9 +57,24 @@ class WeaviateClient:
         """
         self.port = port
         self.ollama_api_endpoint = ollama_api_endpoint
-        self.client = None # Will be connected as needed
+        self.client = None # Persistent connection, reused by every method
+        self._schema_cache = None # Last result of list_collections
+        self._schema_ts = 0.0
+        self._known_collections: Optional[Set[str]] = None # Collection names, fetched once and kept in sync locally
+        self._collection_cache: Dict[str, weaviate.collections.Collection] = {} # Collection handles by name, bound to the current client
+
+        logging.info("WeaviateClient initialized with port: %s and Ollama endpoint: %s", self.port, self.ollama_api_endpoint)
+        try:
+            self._connect_client()
+        except Exception:
+            pass # Already logged; _ensure_connected() retries on the next call
+        atexit.register(self._close_client)
 
-        logging.info(f"WeaviateClient initialized with port: {self.port} and Ollama endpoint: {self.ollama_api_endpoint}")
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._close_client()
 
     def _connect_client(self):
         """
@@ -56,14 +84,37 @@ class WeaviateClient:
         try:
             if not self.client or not self.client.is_connected():
                 self.client = weaviate.connect_to_local(port=self.port)
-                logging.info(f"Successfully connected to Weaviate at port {self.port}.")
+                self._collection_cache.clear() # Handles from a previous client are stale
+                logging.info("Successfully connected to Weaviate at port %s.", self.port)
             return self.client
         except Exception as e:
-            logging.error(f"Failed to connect to Weaviate at port {self.port}: {e}")
+            logging.error("Failed to connect to Weaviate at port %s: %s", self.port, e)
             print(f"Error: Failed to connect to Weaviate at port {self.port}. Please ensure Weaviate is running. {e}")
             self.client = None # Reset client if connection fails
             raise # Re-raise to let calling methods handle connection failure
 
+    def _ensure_connected(self):
+        """
+        Internal method returning the persistent client.
+        Reconnects only when the connection was never established or has been lost.
+        """
+        if self.client is not None and self.client.is_connected():
+            return self.client
+        return self._connect_client()
+
+    def _get_coll(self, name: str) -> weaviate.collections.Collection:
+        """
+        Internal method returning the collection handle for `name`, created once per client.
+        Only for query paths; batching needs its own handle (see `add_data_iter`).
+
+        Args:
+            name (str): The name of the collection.
+        """
+        collection = self._collection_cache.get(name)
+        if collection is None:
+            collection = self._collection_cache[name] = self.client.collections.get(name=name)
+        return collection
+
     def _close_client(self):
         """
         Internal method to close the Weaviate client connection.
@@ -79,19 +130,22 @@ class WeaviateClient:
 
         Args:
             name (str): The name of the collection to create.
+
+        Returns:
+            Union[bool, str]: True if the collection was created, otherwise a message
+                              explaining why it was not.
         """
         try:
-            client = self._connect_client()
+            client = self._ensure_connected()
             if client:
-                logging.info(f"Attempting to create collection: '{name}'")
-                print(f"Creating collection: {name}")
+                logging.info("Attempting to create collection: '%s'", name)
 
-                # Check if collection already exists to avoid error
-                existing_collections = client.collections.list_all()
-                if name in existing_collections:
-                    print(f"Collection '{name}' already exists. Skipping creation.")
-                    logging.info(f"Collection '{name}' already exists. Skipping creation.")
-                    return
+                # Check if collection already exists to avoid error; the names are only fetched once
+                if self._known_collections is None:
+                    self._known_collections = set(client.collections.list_all())
+                if name in self._known_collections:
+                    logging.info("Collection '%s' already exists. Skipping creation.", name)
+                    return f"Collection '{name}' already exists."
 
                 client.collections.create(
                     name=name,
@@ -100,13 +154,15 @@ class WeaviateClient:
                         model="nomic-embed-text"
                     )
                 )
-                logging.info(f"Collection '{name}' created successfully.")
-                print(f"Collection '{name}' created successfully.")
+                logging.info("Collection '%s' created successfully.", name)
+                self._schema_cache = None
+                self._known_collections.add(name)
+                return True
         except Exception as e:
-            logging.error(f"Error creating collection '{name}': {e}")
+            self._known_collections = None # May be stale (e.g. created elsewhere); refetch next time
+            logging.error("Error creating collection '%s': %s", name, e)
             print(f"Error creating collection '{name}': {e}")
-        finally:
-            self._close_client()
+            return "Error:"+str(e)
 
     def delete_collection(self, name: str):
         """
@@ -116,74 +172,100 @@ class WeaviateClient:
             name (str): The name of the collection to delete.
         """
         try:
-            client = self._connect_client()
+            client = self._ensure_connected()
             if client:
-                logging.info(f"Attempting to delete collection: '{name}'")
+                logging.info("Attempting to delete collection: '%s'", name)
                 client.collections.delete(name=name)
-                logging.info(f"Collection '{name}' deleted successfully.")
+                self._collection_cache.pop(name, None)
+                logging.info("Collection '%s' deleted successfully.", name)
+                self._schema_cache = None
+                if self._known_collections is not None:
+                    self._known_collections.discard(name)
                 print(f"Collection '{name}' deleted successfully.")
                 return True
         except Exception as e:
-            logging.error(f"Error deleting collection '{name}': {e}")
+            logging.error("Error deleting collection '%s': %s", name, e)
             print(f"Error deleting collection '{name}': {e}")
             return "Error:"+str(e)
-        finally:
-            self._close_client()
 
 
 
-    def get_collection_data(self, name: str) -> List[Dict[str, Any]]:
+    def get_collection_data(self, name: str, limit: int = 1000, after: Optional[str] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
         """
-        Retrieve all data objects from a specified collection.
+        Retrieve one page of data objects from a specified collection.
 
         Args:
             name (str): The name of the collection to retrieve data from.
+            limit (int): The maximum number of objects to return.
+            after (Optional[str]): The cursor returned by the previous call, to fetch the next page.
 
         Returns:
-            List[Dict[str, Any]]: A list of dictionaries, where each dictionary
-                                   represents an object's properties in the collection.
+            Tuple[Optional[List[Dict[str, Any]]], Optional[str]]: A list of dictionaries, where each dictionary
+                                   represents an object's properties in the collection, and the cursor
+                                   for the next page (None once the collection is exhausted).
+                                   The list is None if the page could not be fetched.
         """
-        ls = []
+        ls = None
+        cursor = None
         try:
-            client = self._connect_client()
+            client = self._ensure_connected()
             if client:
-                logging.info(f"Attempting to get data from collection: '{name}'")
-                collection = client.collections.get(name=name)
-                for item in collection.iterator():
-                    ls.append(item.properties)
-                logging.info(f"Successfully retrieved {len(ls)} objects from collection '{name}'.")
-                pprint(ls) # Using pprint as in original code
+                logging.info("Attempting to get data from collection: '%s' (limit: %s, after: %s)", name, limit, after)
+                collection = self._get_coll(name)
+                response = collection.query.fetch_objects(limit=limit, after=after)
+                ls = [item.properties for item in response.objects]
+                if len(response.objects) == limit:
+                    cursor = str(response.objects[-1].uuid)
+                logging.info("Successfully retrieved %d objects from collection '%s'.", len(ls), name)
         except Exception as e:
-            logging.error(f"Error getting data from collection '{name}': {e}")
+            logging.error("Error getting data from collection '%s': %s", name, e)
             print(f"Error getting data from collection '{name}': {e}")
-        finally:
-            self._close_client()
-        return ls
+        return ls, cursor
 
     def list_collections(self) -> List[weaviate.collections.Collection]:
         """
         List all collections in the Weaviate instance.
+        The result is reused for `schema_ttl` seconds, or until a collection is created or deleted.
 
         Returns:
             List[weaviate.collections.Collection]: A list of Weaviate Collection objects.
         """
+        if self._schema_cache is not None and time.monotonic() - self._schema_ts < self.schema_ttl:
+            return self._schema_cache
         collections = []
         try:
-            client = self._connect_client()
+            client = self._ensure_connected()
             if client:
                 logging.info("Attempting to list all collections.")
                 collections = client.collections.list_all()
-                logging.info(f"Found {len(collections)} collections.")
-                for col in collections:
-                    print(f"- {col}")
+                logging.info("Found %d collections.", len(collections))
+                logging.debug("collections: %r", collections.keys())
+                self._schema_cache = collections
+                self._schema_ts = time.monotonic()
+                self._known_collections = set(collections)
         except Exception as e:
-            logging.error(f"Error getting collections: {e}")
+            logging.error("Error getting collections: %s", e)
             print(f"Error getting collections: {e}")
-        finally:
-            self._close_client()
         return collections
 
-    def add_data(self, data: List[Dict[str, Any]], collection_name: str):
+    def _pick_batch_size(self, data: Union[List[Dict[str, Any]], Dict[str, Any]]) -> int:
+        """
+        Internal method choosing a batch size from the serialized size of a sample object,
+        so large objects (slow to vectorize) go in smaller batches.
+
+        Args:
+            data (Union[List[Dict[str, Any]], Dict[str, Any]]): The objects about to be added.
+
+        Returns:
+            int: A batch size between 16 and 500.
+        """
+        sample = data if isinstance(data, dict) else (data[0] if data else None)
+        if sample is None:
+            return 200
+        size = max(1, len(orjson.dumps(sample)))
+        return max(16, min(500, 200_000 // size))
+
+    def add_data(self, data: List[Dict[str, Any]], collection_name: str, batch_size: Optional[int] = None, concurrency: int = 4):
         """
         Add data (list of dictionaries) to a specified Weaviate collection.
 
@@ -191,47 +273,210 @@ class WeaviateClient:
             data (List[Dict[str, Any]]): A list of dictionaries, where each dictionary
                                            represents an object to be added.
             collection_name (str): The name of the collection to add data to.
+            batch_size (Optional[int]): The number of objects sent to Weaviate per batch request.
+                                        Picked from the object size when not given.
+            concurrency (int): The number of batch requests kept in flight at once.
+        """
+        if isinstance(data, dict):
+            data = [data]
+        elif not isinstance(data, list):
+            logging.error("Cannot add %s to collection '%s'; expected an object or a list of objects.", type(data).__name__, collection_name)
+            return f"Error:expected a JSON object or a list of objects, got {type(data).__name__}"
+        try:
+            if batch_size is None:
+                batch_size = self._pick_batch_size(data)
+            logging.info("Attempting to add %d objects to collection '%s'.", len(data), collection_name)
+        except Exception as e:
+            logging.error("Error adding data to collection '%s': %s", collection_name, e)
+            print(f"Error adding data to collection '{collection_name}': {e}")
+            return "Error:"+str(e)
+        return self.add_data_iter(data, collection_name, batch_size=batch_size, concurrency=concurrency)
+
+    def add_data_iter(self, iterable: Iterable[Dict[str, Any]], collection_name: str, batch_size: Optional[int] = None, concurrency: int = 4):
+        """
+        Add data to a specified Weaviate collection, pulling objects from any iterable
+        (e.g. a streaming JSON parser) so the whole dataset never has to be in memory.
+
+        Args:
+            iterable (Iterable[Dict[str, Any]]): The objects to be added.
+            collection_name (str): The name of the collection to add data to.
+            batch_size (Optional[int]): The number of objects sent to Weaviate per batch request.
+                                        Picked from the size of the first object when not given.
+            concurrency (int): The number of batch requests kept in flight at once.
+
+        Returns:
+            Union[bool, str]: True if every object was added, otherwise an error message.
         """
+        count = 0
         try:
-            client = self._connect_client()
+            if batch_size is None:
+                # Size from the first object, then put it back in front of the rest
+                iterator = iter(iterable)
+                first = next(iterator, None)
+                batch_size = self._pick_batch_size([first] if first is not None else [])
+                iterable = chain([first], iterator) if first is not None else iterator
+            client = self._ensure_connected()
             if client:
-                logging.info(f"Attempting to add {len(data)} objects to collection '{collection_name}'.")
+                # A fresh handle per call: batch state (incl. failed_objects) lives on the handle,
+                # and the cached ones are shared by every caller of this client
                 store = client.collections.get(name=collection_name)
+                max_errors = 10
 
-                with store.batch.fixed_size(batch_size=200) as batch:
-                    if type(data) != list:
-                        data = [data]
-                    for d in data:
-                        # print(data.index(d)) # Original line, might be heavy for large lists
-                        if batch.number_errors > 10:
+                with store.batch.fixed_size(batch_size=batch_size, concurrent_requests=concurrency) as batch:
+                    add_object = batch.add_object
+                    for count, d in enumerate(iterable, 1):
+                        # Weaviate `add_object` returns the UUID of the added object.
+                        add_object(d)
+                        # Poll the error count every 1024 objects rather than on every object
+                        if (count & 1023) == 0 and batch.number_errors > max_errors:
                             print("Batch import stopped due to excessive errors.")
                             logging.warning("Batch import stopped due to excessive errors.")
                             break
-                        # Weaviate `add_object` returns the UUID of the added object.
-                        # The original code printed `status` which was this UUID.
-                        status = batch.add_object(d)
-                        # print("status", status) # Uncomment if you want to see UUIDs during batching
 
                 # Check for errors in the batch import
                 failed_objects = store.batch.failed_objects
-                if failed_objects:
-                    logging.error(f"Number of failed imports for '{collection_name}': {len(failed_objects)}")
-                    logging.error(f"First failed object details: {failed_objects[0]}")
-                    print(f"Number of failed imports: {len(failed_objects)}")
+                n_failed = len(failed_objects)
+                if n_failed:
+                    logging.error("Number of failed imports for '%s': %d", collection_name, n_failed)
+                    logging.error("First failed object details: %s", failed_objects[0])
+                    print(f"Number of failed imports: {n_failed}")
                     print(f"First failed object: {failed_objects[0]}")
-                    self._close_client()
-                    return f"Number of failed inserts for '{collection_name}': {len(failed_objects)}"
+                    return f"Number of failed inserts for '{collection_name}': {n_failed}"
                 else:
-                    logging.info(f"Successfully added all {len(data)} objects to collection '{collection_name}'.")
-                    print(f"Successfully added all {len(data)} objects to collection '{collection_name}'.")
-                    self._close_client()
+                    logging.info("Successfully added all %d objects to collection '%s'.", count, collection_name)
+                    print(f"Successfully added all {count} objects to collection '{collection_name}'.")
                     return True
 
         except Exception as e:
-            logging.error(f"Error adding data to collection '{collection_name}': {e}")
+            logging.error("Error adding data to collection '%s' after %d objects: %s", collection_name, count, e)
             print(f"Error adding data to collection '{collection_name}': {e}")
-        finally:
-            self._close_client()
+            if count:
+                # Objects queued before the failure are still flushed when the batch closes
+                return f"Error:{e} ({count} objects were already sent to '{collection_name}')"
+            return "Error:"+str(e)
+
+    def add_data_mp(self, data: List[Dict[str, Any]], collection_name: str, n_workers: Optional[int] = None, batch_size: Optional[int] = None):
+        """
+        Add data to a Weaviate collection from several worker processes, each with its own
+        client, so JSON encoding of the batches is not limited to one CPU core.
+
+        Args:
+            data (List[Dict[str, Any]]): A list of dictionaries, where each dictionary
+                                           represents an object to be added.
+            collection_name (str): The name of the collection to add data to.
+            n_workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+            batch_size (Optional[int]): The number of objects sent to Weaviate per batch request.
+                                        Picked from the object size when not given.
+
+        Returns:
+            Union[bool, str]: True if every object was added, otherwise the workers' error messages.
+        """
+        if isinstance(data, dict):
+            data = [data]
+        elif not isinstance(data, list):
+            logging.error("Cannot add %s to collection '%s'; expected an object or a list of objects.", type(data).__name__, collection_name)
+            return f"Error:expected a JSON object or a list of objects, got {type(data).__name__}"
+        if not data:
+            return True
+        if batch_size is None:
+            batch_size = self._pick_batch_size(data)
+        n_workers = min(n_workers or os.cpu_count() or 1, len(data))
+        size = -(-len(data) // n_workers)
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+        # Workers must not inherit this process's gRPC channel, so they are never plain-forked
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+        try:
+            logging.info("Attempting to add %d objects to collection '%s' from %d processes.", len(data), collection_name, len(chunks))
+            with ProcessPoolExecutor(max_workers=len(chunks), mp_context=multiprocessing.get_context(start_method)) as pool:
+                results = list(pool.map(_add_data_worker, repeat(self.port), repeat(self.ollama_api_endpoint),
+                                        chunks, repeat(collection_name), repeat(batch_size)))
+            errors = [str(res) for res in results if res is not True]
+            if errors:
+                return "\n".join(errors)
+            return True
+        except Exception as e:
+            logging.error("Error adding data to collection '%s' from worker processes: %s", collection_name, e)
+            print(f"Error adding data to collection '{collection_name}' from worker processes: {e}")
+            return "Error:"+str(e)
+
+    def add_data_rest(self, data: List[Dict[str, Any]], collection_name: str, batch_size: Optional[int] = None, concurrency: int = 8):
+        """
+        Add data to a Weaviate collection by posting batches straight to the REST
+        `/v1/batch/objects` endpoint, several at a time over one async HTTP client.
+        Intended for very large inserts.
+
+        Args:
+            data (List[Dict[str, Any]]): A list of dictionaries, where each dictionary
+                                           represents an object to be added.
+            collection_name (str): The name of the collection to add data to.
+            batch_size (Optional[int]): The number of objects per request.
+                                        Picked from the object size when not given.
+            concurrency (int): The maximum number of requests in flight at once.
+
+        Returns:
+            Union[bool, str]: True if every object was added, otherwise an error message.
+        """
+        if isinstance(data, dict):
+            data = [data]
+        elif not isinstance(data, list):
+            logging.error("Cannot add %s to collection '%s'; expected an object or a list of objects.", type(data).__name__, collection_name)
+            return f"Error:expected a JSON object or a list of objects, got {type(data).__name__}"
+        if batch_size is None:
+            batch_size = self._pick_batch_size(data)
+        url = f"http://localhost:{self.port}/v1/batch/objects"
+        chunks = [data[i:i + batch_size] for i in range(0, len(data), batch_size)]
+
+        try:
+            logging.info("Attempting to add %d objects to collection '%s' over REST.", len(data), collection_name)
+            results = asyncio.run(self._post_batches(url, collection_name, chunks, concurrency))
+
+            # A request that failed as a whole loses its chunk; the others report per-object errors
+            failed_requests = [(chunk, res) for chunk, res in zip(chunks, results) if isinstance(res, BaseException)]
+            failed_objects = [err for res in results if not isinstance(res, BaseException) for err in res]
+            n_failed = len(failed_objects) + sum(len(chunk) for chunk, _ in failed_requests)
+            if n_failed:
+                logging.error("Number of failed imports for '%s': %d (%d of %d requests failed)",
+                              collection_name, n_failed, len(failed_requests), len(chunks))
+                if failed_requests:
+                    logging.error("First failed request: %s", failed_requests[0][1])
+                    return (f"Number of failed inserts for '{collection_name}': {n_failed} of {len(data)} "
+                            f"({len(failed_requests)} of {len(chunks)} requests failed, first error: {failed_requests[0][1]})")
+                logging.error("First failed object details: %s", failed_objects[0])
+                return f"Number of failed inserts for '{collection_name}': {n_failed} of {len(data)}"
+            logging.info("Successfully added all %d objects to collection '%s' over REST.", len(data), collection_name)
+            return True
+        except Exception as e:
+            logging.error("Error adding data to collection '%s' over REST: %s", collection_name, e)
+            print(f"Error adding data to collection '{collection_name}' over REST: {e}")
+            return "Error:"+str(e)
+
+    async def _post_batches(self, url: str, collection_name: str, chunks: List[List[Dict[str, Any]]], concurrency: int) -> List[Union[List[Any], BaseException]]:
+        """
+        Internal method posting every chunk to the REST batch endpoint with at most
+        `concurrency` requests in flight. Bodies are encoded in worker threads so the
+        event loop keeps sending while the next batch is serialized.
+
+        Returns:
+            List[Union[List[Any], BaseException]]: For each chunk, in order, the errors reported for
+                                                   its failed objects, or the exception if the request failed.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_keepalive_connections=concurrency)
+
+        def encode(chunk: List[Dict[str, Any]]) -> bytes:
+            return orjson.dumps({"objects": [{"class": collection_name, "properties": d} for d in chunk]})
+
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=300) as http:
+            async def post_chunk(chunk: List[Dict[str, Any]]) -> List[Any]:
+                async with semaphore:
+                    body = await asyncio.to_thread(encode, chunk)
+                    response = await http.post(url, content=body, headers={"Content-Type": "application/json"})
+                    response.raise_for_status()
+                    return [obj["result"]["errors"] for obj in orjson.loads(response.content) if (obj.get("result") or {}).get("errors")]
+
+            # Let every request finish even if some fail, so the caller can tell what landed
+            return await asyncio.gather(*(post_chunk(chunk) for chunk in chunks), return_exceptions=True)
 
     def see_data(self, collection_name: str = "snippets"):
         """
@@ -242,18 +487,16 @@ class WeaviateClient:
             collection_name (str): The name of the collection to see data from.
         """
         try:
-            client = self._connect_client()
+            client = self._ensure_connected()
             if client:
-                logging.info(f"Attempting to iterate and print data from collection: '{collection_name}'")
-                collection = client.collections.get(name=collection_name)
+                logging.info("Attempting to iterate and print data from collection: '%s'", collection_name)
+                collection = self._get_coll(collection_name)
                 for item in collection.iterator():
                     print(item)
-                logging.info(f"Finished iterating data from collection '{collection_name}'.")
+                logging.info("Finished iterating data from collection '%s'.", collection_name)
         except Exception as e:
-            logging.error(f"Error seeing data in collection '{collection_name}': {e}")
+            logging.error("Error seeing data in collection '%s': %s", collection_name, e)
             print(f"Error seeing data in collection '{collection_name}': {e}")
-        finally:
-            self._close_client()
 
     def search(self, query: str, k: int = 10, collection_name: str = "snippets") -> Union[List[Dict[str, Any]], str]:
         """
@@ -270,10 +513,10 @@ class WeaviateClient:
         """
         results = []
         try:
-            client = self._connect_client()
+            client = self._ensure_connected()
             if client:
-                logging.info(f"Performing search in '{collection_name}' for query: '{query}' (limit: {k})")
-                target_collection = client.collections.get(collection_name)
+                logging.info("Performing search in '%s' for query: '%s' (limit: %s)", collection_name, query, k)
+                target_collection = self._get_coll(collection_name)
 
                 response = target_collection.query.near_text(
                     query=query,
@@ -283,8 +526,7 @@ class WeaviateClient:
                 for obj in response.objects:
                     results.append(obj.properties)
 
-                logging.info(f"Found {len(results)} results for query: '{query}'.")
-                pprint(results) # Using pprint as in original code
+                logging.info("Found %d results for query: '%s'.", len(results), query)
 
                 if not results: # If no results found, return an informative message
                     return "No results found for your query."
@@ -292,11 +534,9 @@ class WeaviateClient:
                 return results
 
         except Exception as e:
-            logging.error(f"Error performing semantic search in '{collection_name}' for query '{query}': {e}")
+            logging.error("Error performing semantic search in '%s' for query '%s': %s", collection_name, query, e)
             print(f"Error performing semantic search: {e}")
             return "Error reaching the LLM or Vector instance, or other search error."
-        finally:
-            self._close_client()
 
     def load_data(self, collection_name: str, file_name: str = "docs.json"):
         """
@@ -314,15 +554,14 @@ class WeaviateClient:
 
         try:
             if not os.path.exists(data_path):
-                logging.warning(f"Data file not found at: {data_path}. Using hardcoded example data.")
+                logging.warning("Data file not found at: %s. Using hardcoded example data.", data_path)
                 print(f"Warning: Data file not found at: {data_path}. Using hardcoded example data.")
                 # Original hardcoded data as fallback
                 data_to_add = [{"story1": "story1_code"}, {"story2": "story2_code"}]
             else:
-                with open(data_path, 'r') as f:
-                    data_to_add = json.load(f)
-                logging.info(f"Loaded {len(data_to_add)} objects from '{data_path}'.")
-                pprint(data_to_add)
+                with open(data_path, 'rb') as f:
+                    data_to_add = orjson.loads(f.read())
+                logging.info("Loaded %d objects from '%s'.", len(data_to_add), data_path)
 
             # Ensure the collection exists before adding data
             # self.create_collection(collection_name) # This would create it, but add_data handles collection fetching
@@ -330,13 +569,21 @@ class WeaviateClient:
             self.add_data(data=data_to_add, collection_name=collection_name)
 
         except json.JSONDecodeError as e:
-            logging.error(f"Error decoding JSON from '{data_path}': {e}")
+            logging.error("Error decoding JSON from '%s': %s", data_path, e)
             print(f"Error: Invalid JSON format in '{data_path}': {e}")
         except Exception as e:
-            logging.error(f"Error loading data for collection '{collection_name}': {e}")
+            logging.error("Error loading data for collection '%s': %s", collection_name, e)
             print(f"Error loading data for collection '{collection_name}': {e}")
 
 
+def _add_data_worker(port: int, ollama_api_endpoint: str, data: List[Dict[str, Any]], collection_name: str, batch_size: int):
+    """
+    Runs in a worker process of `WeaviateClient.add_data_mp`, with its own client and connection.
+    """
+    with WeaviateClient(port=port, ollama_api_endpoint=ollama_api_endpoint) as wv:
+        return wv.add_data(data, collection_name, batch_size=batch_size)
+
+
 # --- Example Usage (equivalent to the original __main__ block) ---
 if __name__ == "__main__":
     from sys import argv
@@ -372,9 +619,14 @@ if __name__ == "__main__":
         if command_code == 0:
             weaviate_helper.create_collection(collection_name)
         elif command_code == 1:
-            weaviate_helper.get_collection_data(collection_name)
+            # Print the collection page by page until the cursor is exhausted
+            rows, cursor = weaviate_helper.get_collection_data(collection_name)
+            pprint(rows if rows is not None else [])
+            while cursor:
+                rows, cursor = weaviate_helper.get_collection_data(collection_name, after=cursor)
+                pprint(rows)
         elif command_code == 2:
-            weaviate_helper.list_collections()
+            pprint(list(weaviate_helper.list_collections()))
         elif command_code == 3:
             # Assumes data is in a folder like 'data_codegenjjs/docs.json'
             # For this to work, ensure you have a directory like 'data_YOUR_COLLECTION_NAME'
@@ -387,7 +639,7 @@ if __name__ == "__main__":
                 search_query = argv[3] # Allow user to specify search query as 4th argument
                 print(f"Using custom search query: '{search_query}'")
             results = weaviate_helper.search(search_query, 30, collection_name)
-            # print("Search Results:", results) # Already printed by pprint in method
+            pprint(results)
         elif command_code == 5:
             # Example: python weaviate_client_module.py 5 my_corpus my_data.json
             if len(argv) < 4:
@@ -405,6 +657,6 @@ if __name__ == "__main__":
     except ValueError:
         print(f"Invalid command code: '{argv[1]}'. Please provide an integer.")
     except Exception as e:
-        logging.critical(f"An unhandled error occurred in main execution: {e}", exc_info=True)
+        logging.critical("An unhandled error occurred in main execution: %s", e, exc_info=True)
         print(f"An unexpected error occurred: {e}")
 